@@ -0,0 +1,108 @@
+"""Smoke tests for the ctypes inotify watchdog (Linux only)."""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.dog import LinuxInotifyWatchdog, create_watchdog  # noqa: E402
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+class LinuxInotifyWatchdogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.events = []
+        self.lock = threading.Lock()
+        self.watchdog = create_watchdog(self.root, on_any=self._record)
+        self.assertIsInstance(self.watchdog, LinuxInotifyWatchdog)
+
+    def tearDown(self) -> None:
+        if self.watchdog._thread is not None:
+            self.watchdog.stop()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _record(self, event) -> None:
+        rel = lambda p: os.path.relpath(p, self.root) if p else ""
+        with self.lock:
+            self.events.append((type(event).__name__, rel(event.src_path), rel(event.dest_path)))
+
+    def _wait_for(self, expected, timeout: float = 2.0) -> None:
+        """Wait until every expected event has been recorded."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if all(e in self.events for e in expected):
+                    return
+            time.sleep(0.01)
+        self.fail(f"missing {[e for e in expected if e not in self.events]}; got {self.events}")
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.root, *parts)
+
+    def test_create_and_modify(self) -> None:
+        self.watchdog.start()
+        with open(self._path("a.txt"), "w") as f:
+            f.write("x")
+        self._wait_for([("FileCreatedEvent", "a.txt", ""), ("FileModifiedEvent", "a.txt", "")])
+
+    def test_move_is_paired(self) -> None:
+        open(self._path("a.txt"), "w").close()
+        os.mkdir(self._path("sub"))
+        self.watchdog.start()
+        os.rename(self._path("a.txt"), self._path("sub", "b.txt"))
+        self._wait_for([("FileMovedEvent", "a.txt", os.path.join("sub", "b.txt"))])
+        self.assertNotIn(("FileDeletedEvent", "a.txt", ""), self.events)
+
+    def test_directory_rename_keeps_watching_children(self) -> None:
+        os.makedirs(self._path("d", "e"))
+        self.watchdog.start()
+        os.rename(self._path("d"), self._path("d2"))
+        self._wait_for([("DirMovedEvent", "d", "d2")])
+        open(self._path("d2", "e", "f.txt"), "w").close()
+        self._wait_for([("FileCreatedEvent", os.path.join("d2", "e", "f.txt"), "")])
+
+    def test_pause_and_resume(self) -> None:
+        self.watchdog.start()
+        self.watchdog.pause()
+        self.assertTrue(self.watchdog.is_paused())
+        open(self._path("ignored.txt"), "w").close()
+        time.sleep(0.1)
+        self.watchdog.resume()
+        self.assertTrue(self.watchdog.is_running())
+        open(self._path("seen.txt"), "w").close()
+        self._wait_for([("FileCreatedEvent", "seen.txt", "")])
+        self.assertNotIn(("FileCreatedEvent", "ignored.txt", ""), self.events)
+
+    def test_trailing_slash_and_root_removal(self) -> None:
+        self.watchdog = create_watchdog(self.root + "/", on_any=self._record)
+        self.watchdog.start()
+        open(self._path("a.txt"), "w").close()
+        self._wait_for([("FileCreatedEvent", "a.txt", "")])
+        self.assertFalse(any("//" in e[1] for e in self.events))
+        shutil.rmtree(self.root)
+        self._wait_for([("DirDeletedEvent", ".", "")])
+        self.assertFalse(self.watchdog.is_running())
+
+    def test_symlinked_root(self) -> None:
+        link = self.root + "-link"
+        os.symlink(self.root, link)
+        try:
+            events = []
+            watchdog = create_watchdog(link, on_created=events.append)
+            with watchdog:
+                open(self._path("a.txt"), "w").close()
+                time.sleep(0.2)
+            self.assertEqual([e.src_path for e in events], [os.path.join(link, "a.txt")])
+        finally:
+            os.unlink(link)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,15 +2,60 @@ import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox
 import os
+import re
+import glob
 import json
+import fnmatch
 import datetime
 import platform
+import threading
 from pathlib import Path
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from utils.file_handler import FileHandler
-from utils.dog import create_watchdog
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+# orjson is optional; both paths produce compact UTF-8 JSON bytes
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
 
 DATA_FILE = "config_manager_data.json"
+AUTO_BACKUP_DEBOUNCE_MS = 500  # Coalesce editor save bursts into one backup
+SAVE_DELAY_MS = 250  # Coalesce bursts of state changes into one write
+DETECT_INSERT_CHUNK = 200  # Detection result rows inserted per event-loop tick
+
+# Source file state at its most recent backup, used to hardlink unchanged files
+_BackupRecord = namedtuple("_BackupRecord", ["size", "mtime_ns", "path"])
+
+
+def _normalize_path(path):
+    """Canonical form used to compare paths (case-folded on Windows)"""
+    return os.path.normcase(os.path.normpath(path))
+
+
+class _ManagedFileEventHandler(PatternMatchingEventHandler):
+    """Forwards modify events for the named files in one folder, filtered by watchdog"""
+
+    def __init__(self, filenames, callback):
+        super().__init__(
+            patterns=[glob.escape(name) for name in filenames],
+            ignore_directories=True,
+            case_sensitive=os.name != "nt",
+        )
+        self._callback = callback
+
+    def on_modified(self, event):
+        self._callback(event)
 
 class OrcaSlicerConfigManager(tb.Window):
     def __init__(self, theme='darkly'):
@@ -22,11 +67,19 @@ class OrcaSlicerConfigManager(tb.Window):
         # Data/persistence
         self.file_handler = FileHandler()
         self.managed_files = {}  # {file_id: path}
+        self._path_to_id = {}  # {normalized path: file_id}, inverse of managed_files
         self.file_counter = 0
         self.backup_dir = ""  # Chosen backup root
         self.auto_backup_enabled = True  # Default
-
-        self.file_watchdogs = {}
+        self._dirty = False  # Unsaved state changes pending
+        self._save_after_id = None
+
+        # One observer thread serves every watched folder
+        self._observer = Observer()
+        self._watches = {}  # {normalized folder: (ObservedWatch, handler)}
+        self._pending_backups = set()  # Paths waiting for the debounced auto-backup
+        self._debounce_after_id = None
+        self._last_backups = {}  # {source path: _BackupRecord}
         
         self.detection_config = {
             "app_name": "OrcaSlicer",
@@ -129,11 +182,11 @@ class OrcaSlicerConfigManager(tb.Window):
         status_bar.pack(side=BOTTOM, fill=X)
 
         # Populate loaded files in tree
-        for file_id, path in self.managed_files.items():
-            self.file_tree.insert(parent="", index=END, iid=file_id, values=(path,))
-        # Start watcher for each file
-        for file_id, path in self.managed_files.items():
-            self.ensure_watcher_for_file(path)
+        self._insert_file_rows(self.managed_files.items())
+        # Start watcher for each folder holding managed files
+        for parent_dir in {os.path.dirname(path) for path in self.managed_files.values()}:
+            self._refresh_watch(parent_dir)
+        self._observer.start()
 
         self.protocol("WM_DELETE_WINDOW", self.on_quit)
 
@@ -183,57 +236,116 @@ class OrcaSlicerConfigManager(tb.Window):
         if not self.detection_config["app_name"]:
             messagebox.showwarning("App Name Required", "Please enter an application name to search for.")
             return
+        if not self.detection_config["file_patterns"]:
+            messagebox.showwarning("File Patterns Required", "Please enter at least one file pattern.")
+            return
         
-        self.status_var.set(f"Scanning for {self.detection_config['app_name']} configs...")
-        self.update_idletasks()
-        
-        found_files = []
         app_name = self.detection_config["app_name"]
-        
-        for base_dir in self.detection_config["search_dirs"]:
-            try:
-                # Look for directories matching the app name
-                for root, dirs, files in os.walk(base_dir, topdown=True):
-                    # Filter out excluded directories
-                    dirs[:] = [d for d in dirs if not any(
-                        excl in d.lower() for excl in self.detection_config["exclude_patterns"]
-                    )]
-                    
-                    # Check if current directory contains app_name/subdirectory pattern
-                    path_lower = root.lower()
-                    valid_paths = [os.path.join(app_name, subdir).lower() 
-                                for subdir in self.detection_config["subdirectories"]]
-                    if not any(valid_path in path_lower for valid_path in valid_paths):
-                        # Don't search too deep if pattern isn't in path
-                        if root.count(os.sep) - base_dir.count(os.sep) > 3:
-                            dirs[:] = []
-                        continue
-                    
-                    # Check files against patterns
-                    for filename in files:
-                        filepath = os.path.join(root, filename)
-                        
-                        # Check if file matches any pattern
-                        if any(Path(filename).match(pattern) for pattern in self.detection_config["file_patterns"]):
-                            # Check if not already managed
-                            if filepath not in self.managed_files.values():
-                                found_files.append(filepath)
-                    
-                    # Limit search depth in app directories
-                    if root.count(os.sep) - base_dir.count(os.sep) > 5:
-                        dirs[:] = []
-                        
-            except (PermissionError, OSError) as e:
-                # Skip directories we can't access
-                continue
-        
+        subdirectories = self.detection_config["subdirectories"]
+
+        # Compile patterns once so the walk does a single regex test per name
+        file_patterns = self.detection_config["file_patterns"]
+        # Path.match was case-insensitive on Windows; keep that behaviour
+        file_re = re.compile("|".join(fnmatch.translate(p) for p in file_patterns),
+                             re.IGNORECASE if os.name == "nt" else 0)
+        exclude_patterns = self.detection_config["exclude_patterns"]
+        # Case-insensitive so directory names can be tested without lowering each one
+        excl_re = re.compile("|".join(re.escape(e) for e in exclude_patterns), re.IGNORECASE) if exclude_patterns else None
+
+        # Scan off the Tk thread so the window stays responsive
+        self.detect_btn.configure(state=DISABLED)
+        self.status_var.set(f"Scanning for {app_name} configs...")
+        threading.Thread(
+            target=self._scan_worker,
+            args=(app_name, list(subdirectories), list(self.detection_config["search_dirs"]), file_re, excl_re),
+            daemon=True,
+        ).start()
+
+    def _scan_worker(self, app_name, subdirectories, search_dirs, file_re, excl_re):
+        """Runs the detection scan on a background thread; Tk updates go through after()"""
+        found_files = set()  # search dirs may overlap (e.g. ~ and ~/.config)
+        try:
+            # Try the standard <search dir>/<app>/<subdir> layout first; only walk
+            # whole search dirs when none of those folders exist
+            scan_roots = []  # (root, depth below search dir, root already inside app dir)
+            for subdir in subdirectories:
+                app_depth = len(Path(app_name, subdir).parts)
+                for base_dir in search_dirs:
+                    candidate = os.path.join(base_dir, app_name, subdir)
+                    if os.path.isdir(candidate):
+                        scan_roots.append((candidate, app_depth, True))
+            if not scan_roots:
+                scan_roots = [(base_dir, 0, False) for base_dir in search_dirs]
+
+            # Fragments marking an app directory, e.g. "/orcaslicer/user"; built once per scan
+            valid_paths = tuple(
+                os.sep + os.path.normpath(os.path.join(app_name, subdir)).lower()
+                for subdir in subdirectories
+            )
+
+            # Walk each root on its own thread
+            if scan_roots:
+                with ThreadPoolExecutor(max_workers=min(8, len(scan_roots))) as pool:
+                    futures = [
+                        pool.submit(self._scan_search_dir, root, valid_paths, file_re, excl_re,
+                                    self._path_to_id, depth, in_app_dir)
+                        for root, depth, in_app_dir in scan_roots
+                    ]
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        found_files.update(future.result())
+                        self.after(0, self.status_var.set,
+                                   f"Scanning for {app_name} configs... "
+                                   f"({done}/{len(futures)} locations, {len(found_files)} found)")
+        finally:
+            self.after(0, self._finish_detection, app_name, found_files)
+
+    def _finish_detection(self, app_name, found_files):
+        """Shows the scan results back on the Tk thread"""
+        self.detect_btn.configure(state=NORMAL)
+        # Files may have been added by hand while the scan ran
+        found_files = [path for path in found_files if _normalize_path(path) not in self._path_to_id]
         if not found_files:
             self.status_var.set(f"No new {app_name} configs found.")
             messagebox.showinfo("Auto-Detect Complete", f"No new config files found for {app_name}.")
             return
         
         # Show selection dialog
-        self._show_detection_results(found_files)
+        self.status_var.set(f"Found {len(found_files)} new {app_name} config file(s).")
+        self._show_detection_results(sorted(found_files))
+
+    def _scan_search_dir(self, base_dir, valid_paths, file_re, excl_re, managed_paths,
+                         depth=0, in_app_dir=False):
+        """Walks one search dir for unmanaged config files (runs on a worker thread, no Tk calls)"""
+        found_files = []
+        # Look for directories matching the app name
+        # Entries are (path, depth below the search dir, whether an ancestor already matched the app dir)
+        stack = [(base_dir, depth, in_app_dir)]
+        while stack:
+            root, depth, in_app_dir = stack.pop()
+
+            # Check if current directory contains app_name/subdirectory pattern;
+            # once it does, every descendant does too
+            if not in_app_dir:
+                path_lower = root.lower()
+                in_app_dir = any(valid_path in path_lower for valid_path in valid_paths)
+            # Don't search too deep if pattern isn't in path; limit depth in app directories
+            descend = depth <= (5 if in_app_dir else 3)
+
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Filter out excluded directories
+                            if descend and not (excl_re and excl_re.search(entry.name)):
+                                stack.append((entry.path, depth + 1, in_app_dir))
+                        elif in_app_dir and file_re.match(entry.name):
+                            # Check if not already managed
+                            if _normalize_path(entry.path) not in managed_paths:
+                                found_files.append(entry.path)
+            except OSError:
+                # Skip directories we can't access
+                continue
+        return found_files
 
     def _show_detection_results(self, found_files):
         """Display detected files and let user select which to add"""
@@ -272,12 +384,28 @@ class OrcaSlicerConfigManager(tb.Window):
         tree.configure(yscrollcommand=scroll.set)
         scroll.pack(side=RIGHT, fill=Y)
         
-        # Add files to tree
-        selected_items = {}
-        for idx, filepath in enumerate(found_files):
-            item_id = f"item_{idx}"
-            tree.insert("", END, iid=item_id, text="☐", values=(filepath,))
-            selected_items[item_id] = {"path": filepath, "selected": False}
+        # Add files to tree in chunks so large result sets don't block the event loop
+        selected_items = {f"item_{idx}": {"path": filepath, "selected": False}
+                          for idx, filepath in enumerate(found_files)}
+        item_ids = list(selected_items)
+        inserted = 0  # Rows materialised so far
+
+        def insert_chunk(start):
+            nonlocal inserted
+            if not dialog.winfo_exists():
+                return
+            end = min(start + DETECT_INSERT_CHUNK, len(item_ids))
+            for item_id in item_ids[start:end]:
+                item_data = selected_items[item_id]
+                text = "☑" if item_data["selected"] else "☐"
+                tree.insert("", END, iid=item_id, text=text, values=(item_data["path"],))
+            inserted = end
+            if end < len(item_ids):
+                # Scheduled on the main window: destroying the dialog deletes callbacks
+                # registered through it, and the winfo_exists() guard above must still run
+                self.after(1, insert_chunk, end)
+
+        insert_chunk(0)
         
         def toggle_selection(event):
             item = tree.focus()
@@ -293,30 +421,36 @@ class OrcaSlicerConfigManager(tb.Window):
         btn_frame = tb.Frame(dialog, padding=10)
         btn_frame.pack(fill=X)
         
+        # Rows not inserted yet pick up their state from selected_items when they are
         def select_all():
-            for item_id in selected_items:
-                selected_items[item_id]["selected"] = True
+            for item_data in selected_items.values():
+                item_data["selected"] = True
+            for item_id in item_ids[:inserted]:
                 tree.item(item_id, text="☑")
         
         def deselect_all():
-            for item_id in selected_items:
-                selected_items[item_id]["selected"] = False
+            for item_data in selected_items.values():
+                item_data["selected"] = False
+            for item_id in item_ids[:inserted]:
                 tree.item(item_id, text="☐")
         
         def add_selected():
-            added = 0
+            new_rows = []
             for item_data in selected_items.values():
                 if item_data["selected"]:
                     filepath = item_data["path"]
                     file_id = f"file_{self.file_counter}"
                     self.file_counter += 1
                     self.managed_files[file_id] = filepath
-                    self.file_tree.insert(parent="", index=END, iid=file_id, values=(filepath,))
-                    self.ensure_watcher_for_file(filepath)
-                    added += 1
+                    self._path_to_id[_normalize_path(filepath)] = file_id
+                    new_rows.append((file_id, filepath))
             
-            self.status_var.set(f"Added {added} config file(s).")
-            self.save_data()
+            self._insert_file_rows(new_rows)
+            # One watch refresh per folder rather than per file
+            for parent_dir in {os.path.dirname(filepath) for _, filepath in new_rows}:
+                self._refresh_watch(parent_dir)
+            self.status_var.set(f"Added {len(new_rows)} config file(s).")
+            self._mark_dirty()
             dialog.destroy()
         
         tb.Button(btn_frame, text="Select All", command=select_all, bootstyle=INFO).pack(side=LEFT, padx=5)
@@ -324,12 +458,23 @@ class OrcaSlicerConfigManager(tb.Window):
         tb.Button(btn_frame, text="Add Selected", command=add_selected, bootstyle=SUCCESS).pack(side=RIGHT, padx=5)
         tb.Button(btn_frame, text="Cancel", command=dialog.destroy, bootstyle=SECONDARY).pack(side=RIGHT, padx=5)
 
+    def _insert_file_rows(self, rows):
+        """Adds (file_id, path) rows to the file list in one idle callback so Tk lays out once"""
+        rows = list(rows)
+
+        def insert_all():
+            for file_id, path in rows:
+                self.file_tree.insert(parent="", index=END, iid=file_id, values=(path,))
+
+        if rows:
+            self.after_idle(insert_all)
+
     # --- Persistence ---
     def load_data(self):
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE, "r") as f:
-                    data = json.load(f)
+                with open(DATA_FILE, "rb") as f:
+                    data = _json_loads(f.read())
                 self.managed_files = {str(k): v for k, v in data.get("managed_files", {}).items()}
                 self.file_counter = data.get("file_counter", len(self.managed_files))
                 self.backup_dir = data.get("backup_dir", "")
@@ -340,6 +485,7 @@ class OrcaSlicerConfigManager(tb.Window):
                     self.detection_config.update(data["detection_config"])
             except Exception:
                 self.managed_files, self.backup_dir, self.auto_backup_enabled = {}, "", True
+        self._path_to_id = {_normalize_path(path): file_id for file_id, path in self.managed_files.items()}
 
     def save_data(self):
         data = {
@@ -349,24 +495,42 @@ class OrcaSlicerConfigManager(tb.Window):
             "auto_backup_enabled": self.auto_backup_enabled,
             "detection_config": self.detection_config,
         }
-        with open(DATA_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves truncated JSON
+        tmp_file = DATA_FILE + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(_json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, DATA_FILE)
+        self._dirty = False
+
+    def _mark_dirty(self):
+        """Flags state as changed and schedules a single deferred save"""
+        self._dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.after(SAVE_DELAY_MS, self._maybe_flush)
+
+    def _maybe_flush(self):
+        self._save_after_id = None
+        if self._dirty:
+            self.save_data()
 
     # --- File Management ---
     def add_file(self):
         filepath = filedialog.askopenfilename(title="Select config file")
         if not filepath:
             return
-        if filepath in self.managed_files.values():
+        if _normalize_path(filepath) in self._path_to_id:
             messagebox.showwarning("Duplicate File", "This file is already managed.")
             return
         file_id = f"file_{self.file_counter}"
         self.file_counter += 1
         self.managed_files[file_id] = filepath
+        self._path_to_id[_normalize_path(filepath)] = file_id
         self.file_tree.insert(parent="", index=END, iid=file_id, values=(filepath,))
         self.ensure_watcher_for_file(filepath)
         self.status_var.set(f"Added: {os.path.basename(filepath)}")
-        self.save_data()
+        self._mark_dirty()
 
     def remove_file(self):
         selected_id = self.file_tree.focus()
@@ -376,16 +540,18 @@ class OrcaSlicerConfigManager(tb.Window):
         filepath = self.managed_files.get(selected_id)
         if messagebox.askyesno("Confirm Removal", f"Stop managing this file?\n\n{filepath}"):
             del self.managed_files[selected_id]
+            self._path_to_id.pop(_normalize_path(filepath), None)
+            self._refresh_watch(os.path.dirname(filepath))
             self.file_tree.delete(selected_id)
             self.status_var.set(f"Removed: {os.path.basename(filepath)}")
-            self.save_data()
+            self._mark_dirty()
 
     def choose_backup_dir(self):
         dir_selected = filedialog.askdirectory(title="Select a backup root directory")
         if dir_selected:
             self.backup_dir = dir_selected
             self.status_var.set(f"Backup folder set: {self.backup_dir}")
-            self.save_data()
+            self._mark_dirty()
 
     # --- Backup & Restore ---
     def backup_all(self):
@@ -407,14 +573,37 @@ class OrcaSlicerConfigManager(tb.Window):
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         target = os.path.join(self.backup_dir, f"ConfigBackup_{timestamp}")
         try:
+            # Backups within the same second share a folder
             os.makedirs(target, exist_ok=True)
             copied_count = 0
             for path in files:
-                if os.path.exists(path):
-                    fname = os.path.basename(path)
-                    tgtfile = os.path.join(target, fname)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    # Managed file was deleted; nothing to back up
+                    continue
+                fname = os.path.basename(path)
+                tgtfile = os.path.join(target, fname)
+                prev = self._last_backups.get(path)
+                if prev and prev.size == st.st_size and prev.mtime_ns == st.st_mtime_ns:
+                    # Unchanged since the last backup: hardlink it instead of copying
+                    if prev.path != tgtfile:
+                        try:
+                            self.file_handler.link_file(prev.path, tgtfile, overwrite=True)
+                        except FileNotFoundError:
+                            self.file_handler.copy_file(path, tgtfile, overwrite=True)
+                else:
+                    if os.path.lexists(tgtfile):
+                        # A reused folder, or an earlier file with the same basename, may
+                        # have left a hardlink here; don't write through it into an older backup
+                        os.unlink(tgtfile)
                     self.file_handler.copy_file(path, tgtfile, overwrite=True)
-                    copied_count += 1
+                # A same-basename file backed up earlier no longer owns tgtfile
+                for other, rec in list(self._last_backups.items()):
+                    if rec.path == tgtfile and other != path:
+                        del self._last_backups[other]
+                self._last_backups[path] = _BackupRecord(st.st_size, st.st_mtime_ns, tgtfile)
+                copied_count += 1
             self.status_var.set(f"Backup complete: {copied_count} files in {os.path.basename(target)}")
             messagebox.showinfo("Backup Done", f"Backed up {copied_count} files:\n{target}")
         except Exception as e:
@@ -426,18 +615,18 @@ class OrcaSlicerConfigManager(tb.Window):
             messagebox.showwarning("Backup Location", "No backup folder set.")
             return
 
-        candidates = [d for d in os.listdir(self.backup_dir) if d.startswith("ConfigBackup_")]
+        # Newest first; the timestamp format sorts chronologically
+        with os.scandir(self.backup_dir) as it:
+            candidates = sorted(
+                (e.name for e in it if e.name.startswith("ConfigBackup_") and e.is_dir(follow_symlinks=False)),
+                reverse=True,
+            )
         if not candidates:
             messagebox.showinfo("No Backups", "No backups found in the backup folder.")
             return
 
-        import tkinter.simpledialog as sd
-        selected = sd.askstring(
-            "Restore Which Backup?",
-            "Enter backup folder name. Suggestions:\n" + "\n".join(candidates) + "\n\n(Copy from above)",
-            initialvalue=candidates[-1] if candidates else ""
-        )
-        if not selected or selected not in candidates:
+        selected = self._ask_backup_folder(candidates)
+        if not selected:
             self.status_var.set("Restore cancelled.")
             return
         restore_folder = os.path.join(self.backup_dir, selected)
@@ -465,36 +654,123 @@ class OrcaSlicerConfigManager(tb.Window):
         self.status_var.set(f"Restored {restored} files from backup.")
         messagebox.showinfo("Restore Complete", f"Restored {restored} files.")
 
+    def _ask_backup_folder(self, candidates):
+        """Shows a modal list of backup folders; returns the chosen name or None"""
+        dialog = tb.Toplevel(self)
+        dialog.title("Restore Which Backup?")
+        dialog.geometry("400x400")
+        dialog.transient(self)
+        dialog.grab_set()
+
+        list_frame = tb.Frame(dialog, padding=10)
+        list_frame.pack(fill=BOTH, expand=YES)
+
+        tree = tb.Treeview(
+            list_frame,
+            columns=("name",),
+            show="headings",
+            selectmode="browse",
+            bootstyle=INFO
+        )
+        tree.pack(side=LEFT, fill=BOTH, expand=YES)
+        tree.heading("name", text="Backup Folder")
+
+        scroll = tb.Scrollbar(list_frame, orient=VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scroll.set)
+        scroll.pack(side=RIGHT, fill=Y)
+
+        for name in candidates:
+            tree.insert("", END, iid=name, values=(name,))
+        tree.selection_set(candidates[0])
+        tree.focus(candidates[0])
+
+        chosen = []
+
+        def confirm(event=None):
+            chosen.extend(tree.selection())
+            dialog.destroy()
+
+        tree.bind("<Double-1>", confirm)
+        tree.bind("<Return>", confirm)
+
+        btn_frame = tb.Frame(dialog, padding=10)
+        btn_frame.pack(fill=X)
+        tb.Button(btn_frame, text="Restore", command=confirm, bootstyle=SUCCESS).pack(side=RIGHT, padx=5)
+        tb.Button(btn_frame, text="Cancel", command=dialog.destroy, bootstyle=SECONDARY).pack(side=RIGHT, padx=5)
+
+        self.wait_window(dialog)
+        return chosen[0] if chosen else None
+
     # --- Auto-Backup (Watchdog) ---
     def ensure_watcher_for_file(self, file_path):
-        parent_dir = os.path.dirname(file_path)
-        if parent_dir in self.file_watchdogs:
-            return
-        def on_event(event):
-            if not self.auto_backup_enabled:
-                return
-            for tracked_path in self.managed_files.values():
-                if event.src_path == tracked_path:
-                    self.status_var.set(f"Auto-backup: {os.path.basename(tracked_path)} changed")
-                    self.backup_single(tracked_path)
+        self._refresh_watch(os.path.dirname(file_path))
+
+    def _refresh_watch(self, parent_dir):
+        """Points the folder's watch at the managed files currently inside it"""
+        dir_key = _normalize_path(parent_dir)
+        filenames = [
+            os.path.basename(path) for path in self.managed_files.values()
+            if _normalize_path(os.path.dirname(path)) == dir_key
+        ]
+        watch, old_handler = self._watches.pop(dir_key, (None, None))
         try:
-            wdog = create_watchdog(parent_dir, on_modified=on_event, recursive=False)
-            wdog.start()
-            self.file_watchdogs[parent_dir] = wdog
+            if filenames:
+                handler = _ManagedFileEventHandler(filenames, self._on_watch_event)
+                if watch is None:
+                    watch = self._observer.schedule(handler, parent_dir, recursive=False)
+                else:
+                    # Swap handlers on the live watch so no events are missed
+                    self._observer.add_handler_for_watch(handler, watch)
+                    self._observer.remove_handler_for_watch(old_handler, watch)
+                self._watches[dir_key] = (watch, handler)
+            elif watch is not None:
+                self._observer.unschedule(watch)
         except Exception as e:
             print("Watchdog error:", e)
 
+    def _on_watch_event(self, event):
+        if not self.auto_backup_enabled:
+            return
+        file_id = self._path_to_id.get(_normalize_path(event.src_path))
+        tracked_path = self.managed_files.get(file_id)
+        if tracked_path:
+            # Runs on the watchdog thread; hand off to the Tk thread
+            self.after(0, self._queue_auto_backup, tracked_path)
+
+    def _queue_auto_backup(self, path):
+        """Collects changed files and restarts the debounce timer"""
+        self.status_var.set(f"Auto-backup: {os.path.basename(path)} changed")
+        self._pending_backups.add(path)
+        if self._debounce_after_id is not None:
+            self.after_cancel(self._debounce_after_id)
+        self._debounce_after_id = self.after(AUTO_BACKUP_DEBOUNCE_MS, self._flush_backups)
+
+    def _flush_backups(self):
+        """Backs up every file changed during the debounce window into one folder"""
+        self._debounce_after_id = None
+        paths = list(self._pending_backups)
+        self._pending_backups.clear()
+        if paths:
+            self._backup_files(paths)
+
     def toggle_auto_backup(self):
         self.auto_backup_enabled = self.auto_backup_var.get()
         self.status_var.set("Auto-backup " + ("Enabled" if self.auto_backup_enabled else "Disabled"))
-        self.save_data()
+        self._mark_dirty()
 
     def on_quit(self):
-        for wdog in self.file_watchdogs.values():
-            try:
-                wdog.stop()
-            except Exception:
-                pass
+        try:
+            self._observer.stop()
+            self._observer.join()
+        except Exception:
+            pass
+        # Back up changes still inside the debounce window instead of losing them
+        if self._debounce_after_id is not None:
+            self.after_cancel(self._debounce_after_id)
+            self._flush_backups()
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
         self.save_data()
         self.destroy()
 
@@ -14,9 +14,23 @@ This module provides a simple interface to monitor file system events
 using the watchdog library with strong typing support.
 """
 
+import os
+import re
+import sys
 import time
+import queue
+import ctypes
+import ctypes.util
+import select
+import signal
+import struct
+import platform
+import functools
+import threading
+import traceback
+from collections import deque
 from pathlib import Path
-from typing import Callable, Optional, List
+from typing import Any, Callable, Deque, Dict, FrozenSet, Optional, List, Pattern, Tuple, Union
 from dataclasses import dataclass
 
 from watchdog.events import (
@@ -32,18 +46,108 @@ from watchdog.events import (
     DirMovedEvent,
 )
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver, ObservedWatch
 
 
-@dataclass
+# on_any receives a list of events instead of a single one when coalescing is enabled
+AnyEventCallback = Callable[[Union[FileSystemEvent, List[FileSystemEvent]]], None]
+
+# Bounded table of interned event paths: events for the same file share one
+# string object, so dict keys built from them hash and compare by identity
+_intern_path = functools.lru_cache(maxsize=65536)(sys.intern)
+
+
+def _noop(event: FileSystemEvent) -> None:
+    """Stand-in for callbacks that were not provided."""
+
+
+# Sentinel telling a CustomEventHandler worker thread to exit
+_STOP_WORKER = object()
+
+
+@dataclass(slots=True, frozen=True)
 class WatchdogConfig:
-    """Configuration for the file watchdog."""
+    """Configuration for the file watchdog (immutable and hashable)."""
     
     path: str
     recursive: bool = True
-    patterns: Optional[List[str]] = None
-    ignore_patterns: Optional[List[str]] = None
+    patterns: Optional[Tuple[str, ...]] = None
+    ignore_patterns: Optional[Tuple[str, ...]] = None
     ignore_directories: bool = False
     case_sensitive: bool = True
+    num_workers: int = 1
+    
+    def __post_init__(self) -> None:
+        """Store pattern lists as tuples so the config stays hashable."""
+        for name in ("patterns", "ignore_patterns"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate one glob pattern to a regex whose wildcards stay within a path component.
+    
+    Unlike fnmatch.translate, "*", "?" and "[...]" never match a path
+    separator, as with the PurePath.match that watchdog uses.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            parts.append(r"[^/\\]*")
+        elif c == "?":
+            parts.append(r"[^/\\]")
+        elif c == "[":
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            j = pattern.find("]", j)
+            if j < 0:
+                parts.append(re.escape(c))
+                continue
+            body = pattern[i:j].replace("\\", r"\\")
+            i = j + 1
+            if body.startswith("^"):
+                # A literal caret in a glob class, not a regex negation
+                body = "\\" + body
+            if body.startswith("!"):
+                parts.append(rf"[^/\\{body[1:]}]")
+            else:
+                # Look ahead so a class listing "/" still can't match a separator
+                parts.append(rf"(?![/\\])[{body}]")
+        else:
+            parts.append(re.escape(c))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: Optional[Tuple[str, ...]], case_sensitive: bool) -> Optional[Pattern[str]]:
+    """
+    Compile glob patterns into a single regex matched against whole paths.
+    
+    Like watchdog's own pattern matching, a pattern matches whole trailing
+    components of the path, so "*.json" and "build/*" work without a leading
+    "*/", and wildcards don't cross separators ("build/*" skips build/a/b).
+    Results are cached, so handlers sharing a config share one regex.
+    
+    Args:
+        patterns: Glob patterns, or None/empty for no filter
+        case_sensitive: Whether matching is case-sensitive
+    
+    Returns:
+        The compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    alternatives = "|".join(_translate_glob(p) for p in patterns)
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(rf"(?s:.*[/\\])?(?:{alternatives})\Z", flags)
 
 
 class CustomEventHandler(FileSystemEventHandler):
@@ -55,7 +159,9 @@ class CustomEventHandler(FileSystemEventHandler):
         on_deleted: Optional[Callable[[FileSystemEvent], None]] = None,
         on_modified: Optional[Callable[[FileSystemEvent], None]] = None,
         on_moved: Optional[Callable[[FileSystemEvent], None]] = None,
-        on_any: Optional[Callable[[FileSystemEvent], None]] = None,
+        on_any: Optional[AnyEventCallback] = None,
+        coalesce_window: Optional[float] = None,
+        config: Optional[WatchdogConfig] = None,
     ) -> None:
         """
         Initialize the event handler with optional callbacks.
@@ -66,38 +172,394 @@ class CustomEventHandler(FileSystemEventHandler):
             on_modified: Callback for file/directory modification events
             on_moved: Callback for file/directory move events
             on_any: Callback for any event (called for all events)
+            coalesce_window: If set, buffer events for this many seconds and
+                pass on_any a list with one event per (type, path), keeping
+                the latest of each; batches are delivered one at a time, in
+                order, from a single flusher thread
+            config: Watchdog configuration whose patterns, ignore_patterns and
+                ignore_directories filter events before any callback runs, and
+                whose num_workers > 1 runs callbacks on that many worker threads
+                between start_workers() and stop_workers() (events for the same
+                path always go to the same worker, in order; a move runs on its
+                destination's worker after earlier events for its source)
         """
         super().__init__()
-        self._on_created = on_created
-        self._on_deleted = on_deleted
-        self._on_modified = on_modified
-        self._on_moved = on_moved
         self._on_any = on_any
+        # Typed callbacks keyed by exact event class, looked up once per event
+        self._dispatch = {
+            FileCreatedEvent: on_created or _noop,
+            DirCreatedEvent: on_created or _noop,
+            FileDeletedEvent: on_deleted or _noop,
+            DirDeletedEvent: on_deleted or _noop,
+            FileModifiedEvent: on_modified or _noop,
+            DirModifiedEvent: on_modified or _noop,
+            FileMovedEvent: on_moved or _noop,
+            DirMovedEvent: on_moved or _noop,
+        }
+        self._coalesce_window = coalesce_window
+        self._pending: Deque[FileSystemEvent] = deque()
+        self._has_pending = threading.Event()
+        # Held across draining and on_any, so batches never overlap or reorder
+        self._deliver_lock = threading.RLock()
+        self._flusher_lock = threading.Lock()
+        # Flusher thread and the Event that halts it, while one is running
+        self._flusher: Optional[Tuple[threading.Thread, threading.Event]] = None
+        
+        if config is None:
+            self._pat_re = self._ignore_re = None
+            self._ignore_directories = False
+        else:
+            self._pat_re = _compile_patterns(config.patterns, config.case_sensitive)
+            self._ignore_re = _compile_patterns(config.ignore_patterns, config.case_sensitive)
+            self._ignore_directories = config.ignore_directories
+        
+        # Specialize delivery for the callbacks actually given; subclasses may
+        # override the on_* hooks, so they keep the generic path
+        if type(self) is CustomEventHandler:
+            typed = (on_created, on_deleted, on_modified, on_moved)
+            if all(callback is None for callback in typed):
+                if on_any is None:
+                    self._deliver = _noop
+                elif coalesce_window is None:
+                    self._deliver = on_any
+                else:
+                    self._deliver = self.on_any_event
+            elif on_any is None:
+                self._deliver = self._deliver_typed
+        else:
+            self._deliver = functools.partial(FileSystemEventHandler.dispatch, self)
+        
+        self._num_workers = config.num_workers if config is not None else 1
+        self._worker_queues: List["queue.SimpleQueue[Any]"] = []
+        self._worker_threads: List[threading.Thread] = []
+    
+    def start_workers(self) -> None:
+        """Start the worker threads, if configured and not already running."""
+        if self._num_workers <= 1 or self._worker_threads:
+            return
+        queues = []
+        for i in range(self._num_workers):
+            events: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+            thread = threading.Thread(
+                target=self._run_worker,
+                args=(events,),
+                name=f"CustomEventHandler-worker-{i}",
+                daemon=True,
+            )
+            thread.start()
+            queues.append(events)
+            self._worker_threads.append(thread)
+        self._worker_queues = queues
+    
+    def stop_workers(self) -> None:
+        """Dispatch every queued event, then shut the worker and flusher threads down."""
+        queues, threads = self._worker_queues, self._worker_threads
+        # Later events are dispatched inline until start_workers() runs again
+        self._worker_queues, self._worker_threads = [], []
+        for events in queues:
+            events.put(_STOP_WORKER)
+        current = threading.current_thread()
+        for thread in threads:
+            # A callback stopping the watchdog can't join its own worker
+            if thread is not current:
+                thread.join()
+        self._stop_flusher()
+    
+    def _run_worker(self, events: "queue.SimpleQueue[Any]") -> None:
+        """Dispatch events from one worker queue until stop_workers()."""
+        while True:
+            event = events.get()
+            if event is _STOP_WORKER:
+                return
+            if isinstance(event, threading.Event):
+                # Marker from wait_idle() or a move: everything queued before it is done
+                event.set()
+                continue
+            if isinstance(event, tuple):
+                # A move from another worker's path waits until that worker caught up
+                marker, event = event
+                marker.wait()
+            try:
+                self._deliver(event)
+            except Exception:
+                # Keep the worker alive so later events for its paths still run
+                traceback.print_exc()
+    
+    def wait_idle(self) -> None:
+        """Block until the worker threads have dispatched every queued event."""
+        markers = []
+        current = threading.current_thread()
+        for events, thread in zip(self._worker_queues, self._worker_threads):
+            # Called from a callback, its own worker can't reach the marker
+            if thread is current:
+                continue
+            marker = threading.Event()
+            events.put(marker)
+            markers.append(marker)
+        for marker in markers:
+            marker.wait()
+    
+    def _accepts_path(self, path: str) -> bool:
+        """Check a path against the include and ignore patterns."""
+        if self._pat_re is not None and not self._pat_re.match(path):
+            return False
+        return self._ignore_re is None or not self._ignore_re.match(path)
+    
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Drop filtered-out events once, before the per-type handlers run."""
+        if self._ignore_directories and event.is_directory:
+            return
+        # Interning returns an equal string, so the event's hash is unchanged
+        if isinstance(event.src_path, str):
+            event.src_path = _intern_path(event.src_path)
+        if getattr(event, "dest_path", None) and isinstance(event.dest_path, str):
+            event.dest_path = _intern_path(event.dest_path)
+        if self._pat_re is not None or self._ignore_re is not None:
+            # A move is relevant if either of its paths is
+            paths = [os.fsdecode(event.src_path)]
+            dest_path = getattr(event, "dest_path", "")
+            if dest_path:
+                paths.append(os.fsdecode(dest_path))
+            if not any(self._accepts_path(path) for path in paths):
+                return
+        queues = self._worker_queues
+        if queues:
+            # Partition by path so each path's events keep their order
+            index = hash(event.src_path) % len(queues)
+            dest_path = getattr(event, "dest_path", "")
+            if dest_path:
+                dest_index = hash(dest_path) % len(queues)
+                if dest_index != index:
+                    # Run the move on the destination's worker, after the source's
+                    # worker has finished the events queued before it; a marker
+                    # only ever waits on one queued earlier, so this can't deadlock
+                    marker = threading.Event()
+                    queues[index].put(marker)
+                    queues[dest_index].put((marker, event))
+                    return
+            queues[index].put(event)
+            return
+        self._deliver(event)
+    
+    def _deliver(self, event: FileSystemEvent) -> None:
+        """Run on_any, then the callback for the event's type (as watchdog orders them)."""
+        self.on_any_event(event)
+        self._dispatch.get(type(event), _noop)(event)
+    
+    def _deliver_typed(self, event: FileSystemEvent) -> None:
+        """Run only the callback for the event's type, when on_any is unset."""
+        self._dispatch.get(type(event), _noop)(event)
+    
+    # Hooks for watchdog's generic dispatch, which subclasses go through so
+    # their own on_* overrides (and super() calls into these) still run
     
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file/directory creation events."""
-        if self._on_created:
-            self._on_created(event)
+        self._dispatch.get(type(event), _noop)(event)
     
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file/directory deletion events."""
-        if self._on_deleted:
-            self._on_deleted(event)
+        self._dispatch.get(type(event), _noop)(event)
     
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file/directory modification events."""
-        if self._on_modified:
-            self._on_modified(event)
+        self._dispatch.get(type(event), _noop)(event)
     
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file/directory move events."""
-        if self._on_moved:
-            self._on_moved(event)
+        self._dispatch.get(type(event), _noop)(event)
+    
+    def event_filter(self) -> Optional[List[type]]:
+        """
+        Event classes that reach a callback, for filtering in the kernel.
+        
+        Returns:
+            The classes with a typed callback, or None if every event is
+            needed (on_any is set, or a subclass may override the on_* hooks)
+        """
+        if self._on_any is not None or type(self) is not CustomEventHandler:
+            return None
+        return [
+            event_cls
+            for event_cls, callback in self._dispatch.items()
+            if callback is not _noop and not (self._ignore_directories and event_cls.is_directory)
+        ]
     
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle any file system event."""
-        if self._on_any:
+        if not self._on_any:
+            return
+        if self._coalesce_window is None:
             self._on_any(event)
+            return
+        self._pending.append(event)
+        if self._flusher is None:
+            self._start_flusher()
+        if not self._has_pending.is_set():
+            self._has_pending.set()
+    
+    def _start_flusher(self) -> None:
+        """Start the thread delivering coalesced batches, unless one is running."""
+        with self._flusher_lock:
+            if self._flusher is not None:
+                return
+            halt = threading.Event()
+            thread = threading.Thread(
+                target=self._run_flusher,
+                args=(halt,),
+                name="CustomEventHandler-flusher",
+                daemon=True,
+            )
+            thread.start()
+            self._flusher = (thread, halt)
+    
+    def _stop_flusher(self) -> None:
+        """Halt and join the flusher thread; buffered events wait for flush()."""
+        with self._flusher_lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is None:
+            return
+        thread, halt = flusher
+        halt.set()
+        self._has_pending.set()
+        # An on_any callback stopping the watchdog runs on the flusher itself
+        if thread is not threading.current_thread():
+            thread.join()
+    
+    def _run_flusher(self, halt: threading.Event) -> None:
+        """Deliver a batch each time events have been buffered for a window."""
+        while True:
+            self._has_pending.wait()
+            # Let the window fill; halting cuts the wait short
+            if halt.wait(self._coalesce_window):
+                return
+            # Events buffered after this point set the flag again for the next batch
+            self._has_pending.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Keep delivering later batches
+                traceback.print_exc()
+    
+    def flush(self) -> None:
+        """Deliver any buffered events to on_any now."""
+        with self._deliver_lock:
+            batch = {}
+            while self._pending:
+                event = self._pending.popleft()
+                key = (type(event), event.src_path)
+                # Re-insert so the batch is ordered by each key's latest event
+                batch.pop(key, None)
+                batch[key] = event
+            if batch:
+                self._on_any(list(batch.values()))
+
+
+class _DequeEventQueue:
+    """
+    Drop-in replacement for the observer's mutex-protected EventQueue.
+    
+    Emitters append to a deque, whose append/popleft are atomic in CPython,
+    so neither side takes a lock per event. The threading.Event is only used
+    to wake the dispatcher after it has drained the deque. Unlike watchdog's
+    SkipRepeatsQueue, repeated events are not dropped here: that needs the
+    check and the append to be atomic against get(), and CustomEventHandler's
+    coalescing already deduplicates.
+    """
+    
+    def __init__(self) -> None:
+        self._items: Deque[Any] = deque()
+        self._ready = threading.Event()
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Append an item; never blocks since the queue is unbounded."""
+        self._items.append(item)
+        if not self._ready.is_set():
+            self._ready.set()
+    
+    def put_nowait(self, item: Any) -> None:
+        """Append an item without blocking."""
+        self.put(item, block=False)
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Pop the oldest item, waiting for one if block is set."""
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                if not block:
+                    raise queue.Empty
+                # Clear before re-checking so a put racing with us still wakes the wait
+                self._ready.clear()
+                if self._items:
+                    continue
+                if not self._ready.wait(timeout):
+                    raise queue.Empty
+                continue
+            return item
+    
+    def get_nowait(self) -> Any:
+        """Pop the oldest item or raise queue.Empty."""
+        return self.get(block=False)
+    
+    def task_done(self) -> None:
+        """Nothing tracks unfinished items; kept for the Queue interface."""
+    
+    def qsize(self) -> int:
+        """Approximate number of queued items."""
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        """Whether the queue is currently empty."""
+        return not self._items
+
+
+def _event_filter_for(handler: FileSystemEventHandler, recursive: bool) -> Optional[List[type]]:
+    """
+    Event classes to request from the OS for a handler, or None for all.
+    
+    Recursive watches also need directory creations and moves, so new and
+    renamed subdirectories keep being watched.
+    """
+    if not isinstance(handler, CustomEventHandler):
+        return None
+    classes = handler.event_filter()
+    if classes is None:
+        return None
+    if recursive:
+        classes += [cls for cls in (DirCreatedEvent, DirMovedEvent) if cls not in classes]
+    return classes
+
+
+def _select_observer() -> BaseObserver:
+    """
+    Create the native observer for the current platform.
+    
+    Building the backend directly lets inotify skip generating full events.
+    If the native module can't be imported, or the platform has no known
+    native backend, watchdog's generic Observer picks one (kqueue or polling).
+    None of the native backends build a DirectorySnapshot on start (FSEvents
+    only does with suppress_history), so recursive starts stay cheap.
+    
+    Returns:
+        An unstarted observer instance
+    """
+    system = platform.system()
+    # A backend whose native module is missing (e.g. macOS without the
+    # _watchdog_fsevents extension) falls back to watchdog's own selection
+    try:
+        if system == "Linux":
+            from watchdog.observers.inotify import InotifyObserver
+            return InotifyObserver(generate_full_events=False)
+        if system == "Darwin":
+            from watchdog.observers.fsevents import FSEventsObserver
+            return FSEventsObserver()
+        if system == "Windows":
+            from watchdog.observers.read_directory_changes import WindowsApiObserver
+            return WindowsApiObserver()
+    except ImportError:
+        pass
+    return Observer()
 
 
 class FileWatchdog:
@@ -111,8 +573,10 @@ class FileWatchdog:
             config: Configuration for the watchdog
         """
         self.config = config
-        self.observer: Optional[Observer] = None
+        self.observer: Optional[BaseObserver] = None
         self.event_handler: Optional[FileSystemEventHandler] = None
+        # Set while the path is scheduled; None when stopped or paused
+        self._watch: Optional[ObservedWatch] = None
     
     def set_event_handler(self, handler: FileSystemEventHandler) -> None:
         """
@@ -123,34 +587,77 @@ class FileWatchdog:
         """
         self.event_handler = handler
     
+    def _ensure_observer(self) -> BaseObserver:
+        """Create and start the observer thread if it is not running yet."""
+        if self.observer is None:
+            self.observer = _select_observer()
+            # Emitters capture the queue when scheduled, so swap it in beforehand
+            self.observer._event_queue = _DequeEventQueue()
+            self.observer.start()
+        return self.observer
+    
+    def _drain_handler(self, stop_workers: bool = False) -> None:
+        """Deliver events still queued or buffered in the handler, optionally ending its workers."""
+        if isinstance(self.event_handler, CustomEventHandler):
+            if stop_workers:
+                self.event_handler.stop_workers()
+            else:
+                self.event_handler.wait_idle()
+            self.event_handler.flush()
+    
     def start(self) -> None:
-        """Start monitoring the file system."""
-        if self.observer is not None:
+        """Start monitoring the file system, resuming a paused watchdog."""
+        if self._watch is not None:
             raise RuntimeError("Watchdog is already running")
         
         if self.event_handler is None:
             raise RuntimeError("Event handler not set. Call set_event_handler() first")
         
-        self.observer = Observer()
-        self.observer.schedule(
+        if isinstance(self.event_handler, CustomEventHandler):
+            self.event_handler.start_workers()
+        observer = self._ensure_observer()
+        # Handlers without on_any only get the event classes they handle;
+        # inotify turns this into a narrower kernel mask
+        self._watch = observer.schedule(
             self.event_handler,
             self.config.path,
-            recursive=self.config.recursive
+            recursive=self.config.recursive,
+            event_filter=_event_filter_for(self.event_handler, self.config.recursive),
         )
-        self.observer.start()
+    
+    def pause(self) -> None:
+        """Stop watching the path but keep the observer thread for resume()."""
+        if self._watch is None:
+            raise RuntimeError("Watchdog is not running")
+        
+        self.observer.unschedule(self._watch)
+        self._watch = None
+        self._drain_handler()
+    
+    def resume(self) -> None:
+        """Watch the path again after pause()."""
+        if self.observer is None:
+            raise RuntimeError("Watchdog is not paused")
+        self.start()
     
     def stop(self) -> None:
-        """Stop monitoring the file system."""
+        """Stop monitoring the file system and shut down the observer."""
         if self.observer is None:
             raise RuntimeError("Watchdog is not running")
         
         self.observer.stop()
         self.observer.join()
         self.observer = None
+        self._watch = None
+        self._drain_handler(stop_workers=True)
     
     def is_running(self) -> bool:
-        """Check if the watchdog is currently running."""
-        return self.observer is not None and self.observer.is_alive()
+        """Check if the watchdog is currently watching (started and not paused)."""
+        return self._watch is not None and self.observer.is_alive()
+    
+    def is_paused(self) -> bool:
+        """Check if the watchdog is paused with its observer still alive."""
+        return self._watch is None and self.observer is not None
     
     def __enter__(self) -> "FileWatchdog":
         """Context manager entry."""
@@ -159,7 +666,455 @@ class FileWatchdog:
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
-        if self.is_running():
+        if self.observer is not None:
+            self.stop()
+
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+
+_INOTIFY_FLAGS = IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK
+# The configured root may be a symlink to a directory, and its own removal
+# is reported so the watchdog can stop
+_INOTIFY_ROOT_BITS = IN_DELETE_SELF | IN_MOVE_SELF
+_INOTIFY_ALL_EVENTS = IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# Kernel events needed to produce each event class, mirroring watchdog's
+# event_filter handling (creations also cover files moved into the tree)
+_INOTIFY_EVENT_BITS = {
+    FileCreatedEvent: IN_CREATE | IN_MOVED_FROM | IN_MOVED_TO,
+    DirCreatedEvent: IN_CREATE | IN_MOVED_FROM | IN_MOVED_TO,
+    FileDeletedEvent: IN_DELETE,
+    DirDeletedEvent: IN_DELETE,
+    FileModifiedEvent: IN_MODIFY | IN_ATTRIB,
+    DirModifiedEvent: IN_MODIFY | IN_ATTRIB,
+    FileMovedEvent: IN_MOVED_FROM | IN_MOVED_TO,
+    DirMovedEvent: IN_MOVED_FROM | IN_MOVED_TO,
+}
+# struct inotify_event: wd, mask, cookie, len, then len bytes of NUL-padded name
+_INOTIFY_HEADER = struct.Struct("iIII")
+_INOTIFY_READ_SIZE = 65536
+# How long an IN_MOVED_FROM waits for its IN_MOVED_TO before counting as a delete
+_MOVE_PAIR_TIMEOUT = 0.05
+# Past this many slots, a watch table that is mostly dead slots becomes a dict
+_WD_COMPACT_MIN = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _load_libc() -> ctypes.CDLL:
+    """Load libc with the inotify entry points typed."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+class LinuxInotifyWatchdog(FileWatchdog):
+    """
+    FileWatchdog that talks to inotify directly through ctypes.
+    
+    One thread reads the inotify fd, builds the events and hands them
+    straight to the event handler, skipping watchdog's emitter threads,
+    observer queue and dispatcher.
+    
+    Compared with watchdog's inotify backend:
+    - Only created, deleted, modified and moved events are reported; there
+      are no opened/closed events.
+    - Creating, deleting or moving an entry doesn't also report a
+      DirModifiedEvent for its parent directory.
+    - Renaming a directory reports one DirMovedEvent, not a moved event
+      for every entry below it.
+    - If the kernel queue overflows (IN_Q_OVERFLOW), the lost events can't
+      be recovered; a warning is printed to stderr.
+    - Deleting or moving away the watched root reports DirDeletedEvent for
+      it and stops watching, so is_running() turns False.
+    """
+    
+    def __init__(self, config: WatchdogConfig) -> None:
+        """
+        Initialize the watchdog; the inotify fd is opened on start().
+        
+        Args:
+            config: Configuration for the watchdog
+        """
+        super().__init__(config)
+        self._fd: Optional[int] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._watching = False
+        self._root_wd = -1
+        self._mask = _INOTIFY_ALL_EVENTS | _INOTIFY_FLAGS
+        # Event classes some callback wants, or None for all of them
+        self._wanted: Optional[FrozenSet[type]] = None
+        # Guards the watch table between the reader thread and pause()/resume()
+        self._lock = threading.Lock()
+        # Watched directory per watch descriptor, indexed by wd: the kernel hands
+        # out small increasing ints, so a list beats hashing into a dict. wds are
+        # never reused, so once most slots are dead _compact_watches() turns the
+        # list into a dict keyed by wd for the rest of the fd's lifetime.
+        self._wd_paths: Union[List[Optional[bytes]], Dict[int, bytes]] = []
+        self._wd_live = 0
+        # Pending IN_MOVED_FROM records by cookie: (path, is_dir, deadline)
+        self._moved_from: Dict[int, Tuple[bytes, bool, float]] = {}
+        # Events built under the lock, dispatched once it is released so
+        # callbacks may call pause()/resume()
+        self._ready: List[FileSystemEvent] = []
+    
+    def _add_watch(self, path: bytes, is_root: bool = False) -> None:
+        """
+        Watch one directory, skipping ones that vanished or can't be read.
+        
+        The configured root follows symlinks, reports its own removal and
+        raises OSError if it can't be watched.
+        """
+        mask = self._mask
+        if is_root:
+            mask = (mask & ~IN_DONT_FOLLOW) | _INOTIFY_ROOT_BITS
+        wd = _load_libc().inotify_add_watch(self._fd, path, mask)
+        if wd >= 0:
+            wd_paths = self._wd_paths
+            if isinstance(wd_paths, dict):
+                if wd not in wd_paths:
+                    self._wd_live += 1
+            elif wd >= len(wd_paths):
+                wd_paths.extend([None] * (wd + 1 - len(wd_paths)))
+                self._wd_live += 1
+            elif wd_paths[wd] is None:
+                self._wd_live += 1
+            wd_paths[wd] = path
+            if is_root:
+                self._root_wd = wd
+        elif is_root:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), os.fsdecode(path))
+    
+    def _add_tree(self, root: bytes, report: bool = False, is_root: bool = False) -> None:
+        """
+        Watch root and, if recursive, every directory below it.
+        
+        Args:
+            root: Directory to watch
+            report: Dispatch created events for entries found below root, which
+                may have appeared before their directory was watched
+            is_root: root is the configured path (see _add_watch)
+        """
+        self._add_watch(root, is_root)
+        if not self.config.recursive:
+            return
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        self._add_watch(entry.path)
+                        stack.append(entry.path)
+                    if report:
+                        self._emit(DirCreatedEvent if is_dir else FileCreatedEvent, entry.path)
+    
+    def _watches(self) -> List[Tuple[int, bytes]]:
+        """
+        List the live (wd, path) pairs.
+        
+        Walks at most about four slots per live watch, since
+        _compact_watches() keeps the list from being mostly dead slots.
+        """
+        wd_paths = self._wd_paths
+        if isinstance(wd_paths, dict):
+            return list(wd_paths.items())
+        return [(wd, path) for wd, path in enumerate(wd_paths) if path is not None]
+    
+    def _drop_watch(self, wd: int) -> None:
+        """Clear the slot of a watch the kernel removed or we are removing."""
+        wd_paths = self._wd_paths
+        if isinstance(wd_paths, dict):
+            if wd_paths.pop(wd, None) is not None:
+                self._wd_live -= 1
+        elif wd_paths[wd] is not None:
+            wd_paths[wd] = None
+            self._wd_live -= 1
+    
+    def _compact_watches(self) -> None:
+        """
+        Switch the watch table to a dict once the list is mostly dead slots.
+        
+        Called between buffers only, so _handle_buffer() sees one table type.
+        """
+        wd_paths = self._wd_paths
+        if (isinstance(wd_paths, list) and len(wd_paths) > _WD_COMPACT_MIN
+                and self._wd_live * 4 < len(wd_paths)):
+            self._wd_paths = {wd: path for wd, path in enumerate(wd_paths) if path is not None}
+    
+    def _forget_tree(self, root: bytes) -> None:
+        """Stop watching root and everything below it."""
+        prefix = root + b"/"
+        libc = _load_libc()
+        for wd, path in self._watches():
+            if path == root or path.startswith(prefix):
+                self._drop_watch(wd)
+                libc.inotify_rm_watch(self._fd, wd)
+    
+    def _forget_all(self) -> None:
+        """Remove every watch; their IN_IGNORED records are then skipped."""
+        libc = _load_libc()
+        # Clear the slots so late records for old descriptors find None
+        for wd, _ in self._watches():
+            self._drop_watch(wd)
+            libc.inotify_rm_watch(self._fd, wd)
+    
+    def _rename_tree(self, old: bytes, new: bytes) -> None:
+        """Rewrite watched paths after a directory moved within the tree."""
+        prefix = old + b"/"
+        wd_paths = self._wd_paths
+        for wd, path in self._watches():
+            if path == old:
+                wd_paths[wd] = new
+            elif path.startswith(prefix):
+                wd_paths[wd] = new + path[len(old):]
+    
+    def _emit(self, event_cls: type, src: bytes, dest: Optional[bytes] = None) -> None:
+        """
+        Build an event and queue it for _dispatch_ready().
+        
+        Paths stay bytes until here, so records of a class no callback wants
+        are dropped without decoding them or allocating an event.
+        """
+        if self._wanted is not None and event_cls not in self._wanted:
+            return
+        if dest is None:
+            self._ready.append(event_cls(os.fsdecode(src)))
+        else:
+            self._ready.append(event_cls(os.fsdecode(src), os.fsdecode(dest)))
+    
+    def _dispatch_ready(self) -> None:
+        """Hand queued events to the handler outside the lock, keeping the reader alive on errors."""
+        with self._lock:
+            ready, self._ready = self._ready, []
+        for event in ready:
+            try:
+                self.event_handler.dispatch(event)
+            except Exception:
+                traceback.print_exc()
+    
+    def _handle_buffer(self, buf: bytes) -> None:
+        """Turn a buffer of inotify records into handler events."""
+        unpack_from = _INOTIFY_HEADER.unpack_from
+        header_size = _INOTIFY_HEADER.size
+        wd_paths = self._wd_paths
+        indexed = isinstance(wd_paths, list)
+        offset = 0
+        end = len(buf)
+        while offset < end:
+            wd, mask, cookie, length = unpack_from(buf, offset)
+            offset += header_size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                print("inotify event queue overflowed; some file system events were lost", file=sys.stderr)
+                continue
+            if indexed:
+                # Overflow records carry wd -1, which must not index from the end
+                if wd < 0 or wd >= len(wd_paths):
+                    continue
+                directory = wd_paths[wd]
+            else:
+                directory = wd_paths.get(wd)
+            if mask & IN_IGNORED:
+                if directory is not None:
+                    self._drop_watch(wd)
+                continue
+            if directory is None:
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                # Only the root asks for these; its subtree's watches are now meaningless
+                self._emit(DirDeletedEvent, directory)
+                self._forget_all()
+                self._watching = False
+                break
+            path = directory + b"/" + name if name else directory
+            is_dir = bool(mask & IN_ISDIR)
+            
+            if mask & IN_CREATE:
+                self._emit(DirCreatedEvent if is_dir else FileCreatedEvent, path)
+                if is_dir and self.config.recursive:
+                    self._add_tree(path, report=True)
+            elif mask & IN_DELETE:
+                self._emit(DirDeletedEvent if is_dir else FileDeletedEvent, path)
+            elif mask & (IN_MODIFY | IN_ATTRIB):
+                self._emit(DirModifiedEvent if is_dir else FileModifiedEvent, path)
+            elif mask & IN_MOVED_FROM:
+                self._moved_from[cookie] = (path, is_dir, time.monotonic() + _MOVE_PAIR_TIMEOUT)
+            elif mask & IN_MOVED_TO:
+                source = self._moved_from.pop(cookie, None)
+                if source is None:
+                    # Moved in from outside the watched tree
+                    self._emit(DirCreatedEvent if is_dir else FileCreatedEvent, path)
+                    if is_dir and self.config.recursive:
+                        self._add_tree(path)
+                    continue
+                self._emit(DirMovedEvent if is_dir else FileMovedEvent, source[0], path)
+                if is_dir:
+                    self._rename_tree(source[0], path)
+    
+    def _expire_moves(self, force: bool = False) -> None:
+        """Report unpaired IN_MOVED_FROM records as deletions."""
+        now = time.monotonic()
+        for cookie, (path, is_dir, deadline) in list(self._moved_from.items()):
+            if force or deadline <= now:
+                del self._moved_from[cookie]
+                self._emit(DirDeletedEvent if is_dir else FileDeletedEvent, path)
+                if is_dir:
+                    # Moved out of the tree: its watches would report stale paths
+                    self._forget_tree(path)
+    
+    def _run(self) -> None:
+        """Reader thread: wait on the inotify fd until stop() wakes it."""
+        poller = select.epoll()
+        poller.register(self._fd, select.EPOLLIN)
+        poller.register(self._wake_r, select.EPOLLIN)
+        try:
+            while True:
+                timeout = _MOVE_PAIR_TIMEOUT if self._moved_from else -1
+                for fd, _ in poller.poll(timeout):
+                    if fd == self._wake_r:
+                        return
+                    try:
+                        buf = os.read(self._fd, _INOTIFY_READ_SIZE)
+                    except BlockingIOError:
+                        continue
+                    with self._lock:
+                        self._handle_buffer(buf)
+                        self._compact_watches()
+                    self._dispatch_ready()
+                if self._moved_from:
+                    with self._lock:
+                        self._expire_moves()
+                        self._compact_watches()
+                    self._dispatch_ready()
+        finally:
+            poller.close()
+    
+    def start(self) -> None:
+        """Open inotify if needed and start watching, resuming a paused watchdog."""
+        if self._watching:
+            raise RuntimeError("Watchdog is already running")
+        
+        if self.event_handler is None:
+            raise RuntimeError("Event handler not set. Call set_event_handler() first")
+        
+        # Only ask the kernel for events some callback will see; on_any needs them all
+        wanted = None
+        if isinstance(self.event_handler, CustomEventHandler):
+            wanted = self.event_handler.event_filter()
+        self._wanted = frozenset(wanted) if wanted is not None else None
+        classes = _event_filter_for(self.event_handler, self.config.recursive)
+        self._mask = _INOTIFY_FLAGS
+        if classes is None:
+            self._mask |= _INOTIFY_ALL_EVENTS
+        else:
+            for event_cls in classes:
+                self._mask |= _INOTIFY_EVENT_BITS.get(event_cls, 0)
+        
+        opened = self._thread is None
+        if opened:
+            fd = _load_libc().inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err))
+            self._fd = fd
+        
+        try:
+            with self._lock:
+                # normpath: a trailing slash would give "dir//file" event paths
+                self._add_tree(os.fsencode(os.path.normpath(self.config.path)), is_root=True)
+                self._watching = True
+        except OSError:
+            if opened:
+                os.close(self._fd)
+                self._fd = None
+            raise
+        
+        if isinstance(self.event_handler, CustomEventHandler):
+            self.event_handler.start_workers()
+        if opened:
+            self._wake_r, self._wake_w = os.pipe()
+            self._thread = threading.Thread(target=self._run, name="LinuxInotifyWatchdog", daemon=True)
+            self._thread.start()
+    
+    def pause(self) -> None:
+        """Drop every watch but keep the inotify fd and reader thread for resume()."""
+        if not self._watching:
+            raise RuntimeError("Watchdog is not running")
+        
+        with self._lock:
+            self._expire_moves(force=True)
+            self._forget_all()
+            self._compact_watches()
+            self._watching = False
+        self._dispatch_ready()
+        self._drain_handler()
+    
+    def resume(self) -> None:
+        """Watch the path again after pause()."""
+        if self._thread is None:
+            raise RuntimeError("Watchdog is not paused")
+        self.start()
+    
+    def stop(self) -> None:
+        """Stop monitoring and close the inotify fd."""
+        if self._thread is None:
+            raise RuntimeError("Watchdog is not running")
+        
+        os.write(self._wake_w, b"\0")
+        self._thread.join()
+        self._thread = None
+        with self._lock:
+            self._expire_moves(force=True)
+            self._wd_paths = []
+            self._wd_live = 0
+            self._watching = False
+        self._dispatch_ready()
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            os.close(fd)
+        self._fd = self._wake_r = self._wake_w = None
+        self._drain_handler(stop_workers=True)
+    
+    def is_running(self) -> bool:
+        """Check if the watchdog is currently watching (started and not paused)."""
+        return self._watching and self._thread is not None and self._thread.is_alive()
+    
+    def is_paused(self) -> bool:
+        """Check if the watchdog is paused with its reader thread still alive."""
+        return not self._watching and self._thread is not None
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        if self._thread is not None:
             self.stop()
 
 
@@ -169,8 +1124,14 @@ def create_watchdog(
     on_deleted: Optional[Callable[[FileSystemEvent], None]] = None,
     on_modified: Optional[Callable[[FileSystemEvent], None]] = None,
     on_moved: Optional[Callable[[FileSystemEvent], None]] = None,
-    on_any: Optional[Callable[[FileSystemEvent], None]] = None,
+    on_any: Optional[AnyEventCallback] = None,
     recursive: bool = True,
+    coalesce_window: Optional[float] = None,
+    patterns: Optional[List[str]] = None,
+    ignore_patterns: Optional[List[str]] = None,
+    ignore_directories: bool = False,
+    case_sensitive: bool = True,
+    num_workers: int = 1,
 ) -> FileWatchdog:
     """
     Create and configure a file watchdog with callbacks.
@@ -183,53 +1144,128 @@ def create_watchdog(
         on_moved: Callback for move events
         on_any: Callback for any event
         recursive: Whether to monitor subdirectories
+        coalesce_window: Seconds to batch events for on_any (see CustomEventHandler)
+        patterns: Glob patterns of paths to report (all paths if None)
+        ignore_patterns: Glob patterns of paths to drop
+        ignore_directories: Whether to drop directory events
+        case_sensitive: Whether pattern matching is case-sensitive
+        num_workers: Number of threads running the callbacks (1 runs them on
+            the observer thread)
     
     Returns:
         Configured FileWatchdog instance
     """
-    config = WatchdogConfig(path=path, recursive=recursive)
+    config = WatchdogConfig(
+        path=path,
+        recursive=recursive,
+        patterns=patterns,
+        ignore_patterns=ignore_patterns,
+        ignore_directories=ignore_directories,
+        case_sensitive=case_sensitive,
+        num_workers=num_workers,
+    )
     handler = CustomEventHandler(
         on_created=on_created,
         on_deleted=on_deleted,
         on_modified=on_modified,
         on_moved=on_moved,
         on_any=on_any,
+        coalesce_window=coalesce_window,
+        config=config,
     )
     
-    watchdog = FileWatchdog(config)
+    # Linux talks to inotify directly; elsewhere watchdog picks the backend
+    if platform.system() == "Linux":
+        watchdog = LinuxInotifyWatchdog(config)
+    else:
+        watchdog = FileWatchdog(config)
     watchdog.set_event_handler(handler)
     
     return watchdog
 
 
+def _format_event(event: FileSystemEvent) -> str:
+    """Format an event of a type without a precomputed formatter."""
+    return f"[{type(event).__name__}] {event.src_path}\n"
+
+
+def _make_event_formatter(event_cls: type) -> Callable[[FileSystemEvent], str]:
+    """Build a formatter with the event type's log prefix baked in."""
+    prefix = f"[{event_cls.__name__}] "
+    if issubclass(event_cls, (FileMovedEvent, DirMovedEvent)):
+        return lambda event: f"{prefix}{event.src_path}\n  → Moved to: {event.dest_path}\n"
+    return lambda event: f"{prefix}{event.src_path}\n"
+
+
+# Log formatters keyed by exact event type, so logging needs no isinstance checks
+_EVENT_FORMATTERS = {
+    event_cls: _make_event_formatter(event_cls)
+    for event_cls in (
+        FileCreatedEvent,
+        FileDeletedEvent,
+        FileModifiedEvent,
+        FileMovedEvent,
+        DirCreatedEvent,
+        DirDeletedEvent,
+        DirModifiedEvent,
+        DirMovedEvent,
+    )
+}
+
+
 def main() -> None:
     """Test function demonstrating watchdog usage."""
     print("Starting file watchdog test...")
     print("Monitoring current directory for changes (Press Ctrl+C to stop)")
     print("-" * 60)
     
-    def log_event(event: FileSystemEvent) -> None:
-        """Log file system events."""
-        event_type = type(event).__name__
-        print(f"[{event_type}] {event.src_path}")
-        
-        if isinstance(event, (FileMovedEvent, DirMovedEvent)):
-            print(f"  → Moved to: {event.dest_path}")
+    # Buffer event output and write each batch with one flush instead of a
+    # print() (lock + write syscall) per event
+    sys.stdout.flush()
+    # closefd=False so dropping this wrapper never closes the real stdout
+    out = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=65536,
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        closefd=False,
+    )
+    out_lock = threading.Lock()
+    write = out.write
+    get_formatter = _EVENT_FORMATTERS.get
+    
+    def log_event(events: List[FileSystemEvent]) -> None:
+        """Log a coalesced batch of file system events."""
+        with out_lock:
+            for event in events:
+                write(get_formatter(type(event), _format_event)(event))
+            out.flush()
     
     # Create watchdog with the log_event callback
     watchdog = create_watchdog(
         path=".",
         on_any=log_event,
-        recursive=True
+        recursive=True,
+        coalesce_window=0.02,
     )
     
-    try:
-        with watchdog:
-            while True:
-                time.sleep(1)
-    except KeyboardInterrupt:
-        print("\n" + "-" * 60)
-        print("Watchdog stopped")
+    # Sleep until Ctrl+C instead of waking up every second
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    
+    with watchdog:
+        if platform.system() == "Windows":
+            # Blocking waits can't be interrupted by Ctrl+C on Windows
+            while not stop.wait(1):
+                pass
+        else:
+            stop.wait()
+    
+    with out_lock:
+        out.flush()
+    print("\n" + "-" * 60)
+    print("Watchdog stopped")
 
 
 if __name__ == "__main__":
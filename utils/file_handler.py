@@ -1,8 +1,12 @@
 import shutil
 import os
+import sys
 from pathlib import Path
 from typing import Union
 
+# Chunk size for the userspace copy fallback; a whole number of pages
+_COPY_BUFSIZE = 1 << 20
+
 
 class FileHandler:
     def __init__(self) -> None:
@@ -11,12 +15,101 @@ class FileHandler:
     def copy_file(self, src: Union[str, Path], dst: Union[str, Path], overwrite: bool = False) -> None:
         src_path = Path(src)
         dst_path = Path(dst)
-        if not src_path.is_file():
-            raise FileNotFoundError(f"Source file '{src}' does not exist.")
-        if dst_path.exists() and not overwrite:
-            raise FileExistsError(f"Destination '{dst}' already exists. Use overwrite=True to overwrite.")
         dst_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(src_path), str(dst_path))
+        # No stat prechecks: opening src reports a missing source, and opening dst
+        # exclusively (mode "xb") reports an existing destination without a race
+        dst_mode = "wb" if overwrite else "xb"
+        if overwrite:
+            # "wb" would truncate the source before reading it
+            self._check_same_file(src_path, dst_path)
+        try:
+            if sys.platform == "win32":
+                self._copy_windows(src_path, dst_path, dst_mode)
+            elif sys.platform.startswith("linux"):
+                self._copy_sendfile(src_path, dst_path, dst_mode)
+            elif sys.platform == "darwin" and overwrite:
+                # copyfile goes through fcopyfile on macOS
+                shutil.copyfile(str(src_path), str(dst_path))
+            else:
+                self._copy_fileobj(src_path, dst_path, dst_mode)
+            shutil.copystat(str(src_path), str(dst_path))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Source file '{src}' does not exist.") from None
+        except FileExistsError:
+            raise FileExistsError(f"Destination '{dst}' already exists. Use overwrite=True to overwrite.") from None
+
+    @staticmethod
+    def _check_same_file(src_path: Path, dst_path: Path) -> None:
+        try:
+            same = os.path.samefile(src_path, dst_path)
+        except OSError:
+            # Either side missing: nothing to clobber, the copy reports a missing source
+            return
+        if same:
+            raise shutil.SameFileError(f"'{src_path}' and '{dst_path}' are the same file.")
+
+    def _copy_windows(self, src_path: Path, dst_path: Path, dst_mode: str) -> None:
+        import ctypes
+        # Kernel-side copy; the last argument is bFailIfExists
+        if not ctypes.windll.kernel32.CopyFileW(str(src_path), str(dst_path), dst_mode == "xb"):
+            # Some network shares reject CopyFileW; a real I/O error will resurface here
+            self._copy_fileobj(src_path, dst_path, dst_mode)
+
+    def _copy_sendfile(self, src_path: Path, dst_path: Path, dst_mode: str) -> None:
+        with open(src_path, "rb", buffering=0) as fsrc, open(dst_path, dst_mode, buffering=0) as fdst:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            blocksize = max(os.fstat(infd).st_size, _COPY_BUFSIZE)
+            offset = 0
+            try:
+                while True:
+                    sent = os.sendfile(outfd, infd, offset, blocksize)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # Filesystem doesn't support sendfile; only safe to fall back before any data moved
+                if offset:
+                    raise
+                self._copy_stream(fsrc, fdst)
+
+    def _copy_fileobj(self, src_path: Path, dst_path: Path, dst_mode: str) -> None:
+        # Unbuffered: Python's 8 KiB buffer layer would only add a copy on top of 1 MiB reads
+        with open(src_path, "rb", buffering=0) as fsrc, open(dst_path, dst_mode, buffering=0) as fdst:
+            self._copy_stream(fsrc, fdst)
+
+    @staticmethod
+    def _copy_stream(fsrc, fdst) -> None:
+        buf = bytearray(_COPY_BUFSIZE)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            # Raw writes may be partial
+            written = 0
+            while written < n:
+                written += fdst.write(view[written:n])
+
+    def link_file(self, src: Union[str, Path], dst: Union[str, Path], overwrite: bool = False) -> None:
+        src_path = Path(src)
+        dst_path = Path(dst)
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        if overwrite:
+            # Unlinking dst would delete src if they are the same file
+            self._check_same_file(src_path, dst_path)
+            try:
+                dst_path.unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            os.link(src_path, dst_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Source file '{src}' does not exist.") from None
+        except FileExistsError:
+            raise FileExistsError(f"Destination '{dst}' already exists. Use overwrite=True to overwrite.") from None
+        except OSError:
+            # Cross-device or no hardlink support on this filesystem
+            self.copy_file(src_path, dst_path, overwrite=True)
 
     def move_file(self, src: Union[str, Path], dst: Union[str, Path], overwrite: bool = False) -> None:
         src_path = Path(src)